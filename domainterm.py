@@ -1,17 +1,36 @@
 #!/usr/bin/env python3
 
 import asyncio
+import atexit
+import base64
+import heapq
+import http.client
 import json
 import os
 import sys
 import socket
-import urllib.request
+import sqlite3
+import ssl
+import threading
 import urllib.parse
-import urllib.error
-import subprocess
+import urllib.request
 import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+try:
+    import orjson  # Optional: faster JSON encoding/decoding
+except ImportError:
+    orjson = None
+
+try:
+    import watchfiles  # Optional: react to base words file changes instead of polling
+except ImportError:
+    watchfiles = None
 
 def load_env_file(filename=".env"):
     """Load environment variables from .env file"""
@@ -59,148 +78,203 @@ check_required_env_vars(env_vars, REQUIRED_ENV_VARS)
 LLM_BASE_URL = env_vars.get("LLM_BASE_URL", "http://127.0.0.1:1234/v1")
 LLM_API_KEY = env_vars.get("LLM_API_KEY", "lm-studio")
 LLM_MODEL = env_vars["LLM_MODEL"]
+LLM_CHAT_URL = f"{LLM_BASE_URL}/chat/completions"
+LLM_HEADERS = {
+    "Content-Type": "application/json",
+    "Authorization": f"Bearer {LLM_API_KEY}"
+}
 CLOUDFLARE_API_TOKEN = env_vars["CLOUDFLARE_API_TOKEN"]
 CLOUDFLARE_ACCOUNT_ID = env_vars["CLOUDFLARE_ACCOUNT_ID"]
 BASE_WORDS_FILE = "base-words.txt"
-DB_FILE = "db.json"
+DB_FILE = "db.sqlite3"
+LEGACY_DB_FILE = "db.json"  # imported into DB_FILE on first run
 LOG_DIR = "logs"
+LOG_LEVEL = env_vars.get("LOG_LEVEL", "info")  # set to "debug" for per-request detail in the log file
 
-# Processing intervals (in seconds)
+# Google Translate rate limit: pause after each word that needed new translations (in seconds)
 TRANSLATION_INTERVAL = 3.0
-SYNONYM_INTERVAL = 1.0
-WEBIFICATION_INTERVAL = 1.0
-WHOIS_INTERVAL = 0.5
-SEARCH_INTERVAL = 30.0
-RATING_INTERVAL = 0.3
+
+# Rate limits for services with a quota: minimum time between request starts (in seconds)
+WHOIS_INTERVAL = 0.25  # Cloudflare allows about 1200 account API requests per 5 minutes
+SEARCH_INTERVAL = 30.0  # Brave blocks scrapers that search faster
+
+# Background task intervals (in seconds)
 STATUS_INTERVAL = 10.0
 BASE_WORDS_CHECK_INTERVAL = 3.0
-
-# Language codes for translation
-LANGUAGES = [
-    {"name": "Abkhaz", "code": "ab"},
-    {"name": "Acehnese", "code": "ace"},
-    {"name": "Afrikaans", "code": "af"},
-    {"name": "Albanian", "code": "sq"},
-    {"name": "Amharic", "code": "am"},
-    {"name": "Arabic", "code": "ar"},
-    {"name": "Armenian", "code": "hy"},
-    {"name": "Assamese", "code": "as"},
-    {"name": "Aymara", "code": "ay"},
-    {"name": "Azerbaijani", "code": "az"},
-    {"name": "Bambara", "code": "bm"},
-    {"name": "Basque", "code": "eu"},
-    {"name": "Belarusian", "code": "be"},
-    {"name": "Bengali", "code": "bn"},
-    {"name": "Bhojpuri", "code": "bho"},
-    {"name": "Bosnian", "code": "bs"},
-    {"name": "Bulgarian", "code": "bg"},
-    {"name": "Catalan", "code": "ca"},
-    {"name": "Cebuano", "code": "ceb"},
-    {"name": "Chinese (Simplified)", "code": "zh-CN"},
-    {"name": "Chinese (Traditional)", "code": "zh-TW"},
-    {"name": "Corsican", "code": "co"},
-    {"name": "Croatian", "code": "hr"},
-    {"name": "Czech", "code": "cs"},
-    {"name": "Danish", "code": "da"},
-    {"name": "Dutch", "code": "nl"},
-    {"name": "English", "code": "en"},
-    {"name": "Esperanto", "code": "eo"},
-    {"name": "Estonian", "code": "et"},
-    {"name": "Finnish", "code": "fi"},
-    {"name": "French", "code": "fr"},
-    {"name": "Frisian", "code": "fy"},
-    {"name": "Galician", "code": "gl"},
-    {"name": "Georgian", "code": "ka"},
-    {"name": "German", "code": "de"},
-    {"name": "Greek", "code": "el"},
-    {"name": "Gujarati", "code": "gu"},
-    {"name": "Haitian Creole", "code": "ht"},
-    {"name": "Hausa", "code": "ha"},
-    {"name": "Hawaiian", "code": "haw"},
-    {"name": "Hebrew", "code": "iw"},
-    {"name": "Hindi", "code": "hi"},
-    {"name": "Hmong", "code": "hmn"},
-    {"name": "Hungarian", "code": "hu"},
-    {"name": "Icelandic", "code": "is"},
-    {"name": "Igbo", "code": "ig"},
-    {"name": "Indonesian", "code": "id"},
-    {"name": "Irish", "code": "ga"},
-    {"name": "Italian", "code": "it"},
-    {"name": "Japanese", "code": "ja"},
-    {"name": "Javanese", "code": "jw"},
-    {"name": "Kannada", "code": "kn"},
-    {"name": "Kazakh", "code": "kk"},
-    {"name": "Khmer", "code": "km"},
-    {"name": "Korean", "code": "ko"},
-    {"name": "Kurdish", "code": "ku"},
-    {"name": "Kyrgyz", "code": "ky"},
-    {"name": "Lao", "code": "lo"},
-    {"name": "Latin", "code": "la"},
-    {"name": "Latvian", "code": "lv"},
-    {"name": "Lithuanian", "code": "lt"},
-    {"name": "Luxembourgish", "code": "lb"},
-    {"name": "Macedonian", "code": "mk"},
-    {"name": "Malagasy", "code": "mg"},
-    {"name": "Malay", "code": "ms"},
-    {"name": "Malayalam", "code": "ml"},
-    {"name": "Maltese", "code": "mt"},
-    {"name": "Maori", "code": "mi"},
-    {"name": "Marathi", "code": "mr"},
-    {"name": "Mongolian", "code": "mn"},
-    {"name": "Myanmar (Burmese)", "code": "my"},
-    {"name": "Nepali", "code": "ne"},
-    {"name": "Norwegian", "code": "no"},
-    {"name": "Odia (Oriya)", "code": "or"},
-    {"name": "Pashto", "code": "ps"},
-    {"name": "Persian", "code": "fa"},
-    {"name": "Polish", "code": "pl"},
-    {"name": "Portuguese", "code": "pt"},
-    {"name": "Punjabi", "code": "pa"},
-    {"name": "Romanian", "code": "ro"},
-    {"name": "Russian", "code": "ru"},
-    {"name": "Samoan", "code": "sm"},
-    {"name": "Sanskrit", "code": "sa"},
-    {"name": "Scots Gaelic", "code": "gd"},
-    {"name": "Serbian", "code": "sr"},
-    {"name": "Sesotho", "code": "st"},
-    {"name": "Shona", "code": "sn"},
-    {"name": "Sindhi", "code": "sd"},
-    {"name": "Sinhala", "code": "si"},
-    {"name": "Slovak", "code": "sk"},
-    {"name": "Slovenian", "code": "sl"},
-    {"name": "Somali", "code": "so"},
-    {"name": "Spanish", "code": "es"},
-    {"name": "Sundanese", "code": "su"},
-    {"name": "Swahili", "code": "sw"},
-    {"name": "Swedish", "code": "sv"},
-    {"name": "Tajik", "code": "tg"},
-    {"name": "Tamil", "code": "ta"},
-    {"name": "Tatar", "code": "tt"},
-    {"name": "Telugu", "code": "te"},
-    {"name": "Thai", "code": "th"},
-    {"name": "Turkish", "code": "tr"},
-    {"name": "Turkmen", "code": "tk"},
-    {"name": "Ukrainian", "code": "uk"},
-    {"name": "Urdu", "code": "ur"},
-    {"name": "Uyghur", "code": "ug"},
-    {"name": "Uzbek", "code": "uz"},
-    {"name": "Vietnamese", "code": "vi"},
-    {"name": "Welsh", "code": "cy"},
-    {"name": "Xhosa", "code": "xh"},
-    {"name": "Yiddish", "code": "yi"},
-    {"name": "Yoruba", "code": "yo"},
-    {"name": "Zulu", "code": "zu"},
-]
+DB_FLUSH_INTERVAL = 2.0
+DB_FLUSH_MAX_CHANGES = 100  # flush early once this many changes are unsaved
+CACHE_MAXSIZE = 200_000  # entries per cache kept in memory; older ones are read back from the database
+
+# Maximum concurrent requests
+HTTP_CONCURRENCY = 64
+TRANSLATION_CONCURRENCY = 20
+WHOIS_CONCURRENCY = 8
+SEARCH_CONCURRENCY = 2
+NPM_CONCURRENCY = 8
+SOCIAL_CONCURRENCY = 4  # words at a time; each probes every platform at once
+LLM_WORKERS = 4  # workers per LLM stage (synonyms, webifications, ratings)
+AVAILABLE_WORKERS = 16  # available domains whose NPM/social checks run at once
+
+# Batching: maximum words per batch, and how long (in seconds) to wait for a batch to fill
+LLM_BATCH_SIZE = 10
+WHOIS_BATCH_SIZE = 20
+BATCH_WAIT = 0.2
+
+# Back-pressure: items each queue holds, and how long (in seconds) a producer waits for room before dropping an item
+QUEUE_MAXSIZE = 10_000
+QUEUE_PUT_TIMEOUT = 5.0
+
+# Language (name, code) pairs for translation
+LANGUAGES = (
+    ("Abkhaz", "ab"),
+    ("Acehnese", "ace"),
+    ("Afrikaans", "af"),
+    ("Albanian", "sq"),
+    ("Amharic", "am"),
+    ("Arabic", "ar"),
+    ("Armenian", "hy"),
+    ("Assamese", "as"),
+    ("Aymara", "ay"),
+    ("Azerbaijani", "az"),
+    ("Bambara", "bm"),
+    ("Basque", "eu"),
+    ("Belarusian", "be"),
+    ("Bengali", "bn"),
+    ("Bhojpuri", "bho"),
+    ("Bosnian", "bs"),
+    ("Bulgarian", "bg"),
+    ("Catalan", "ca"),
+    ("Cebuano", "ceb"),
+    ("Chinese (Simplified)", "zh-CN"),
+    ("Chinese (Traditional)", "zh-TW"),
+    ("Corsican", "co"),
+    ("Croatian", "hr"),
+    ("Czech", "cs"),
+    ("Danish", "da"),
+    ("Dutch", "nl"),
+    ("English", "en"),
+    ("Esperanto", "eo"),
+    ("Estonian", "et"),
+    ("Finnish", "fi"),
+    ("French", "fr"),
+    ("Frisian", "fy"),
+    ("Galician", "gl"),
+    ("Georgian", "ka"),
+    ("German", "de"),
+    ("Greek", "el"),
+    ("Gujarati", "gu"),
+    ("Haitian Creole", "ht"),
+    ("Hausa", "ha"),
+    ("Hawaiian", "haw"),
+    ("Hebrew", "iw"),
+    ("Hindi", "hi"),
+    ("Hmong", "hmn"),
+    ("Hungarian", "hu"),
+    ("Icelandic", "is"),
+    ("Igbo", "ig"),
+    ("Indonesian", "id"),
+    ("Irish", "ga"),
+    ("Italian", "it"),
+    ("Japanese", "ja"),
+    ("Javanese", "jw"),
+    ("Kannada", "kn"),
+    ("Kazakh", "kk"),
+    ("Khmer", "km"),
+    ("Korean", "ko"),
+    ("Kurdish", "ku"),
+    ("Kyrgyz", "ky"),
+    ("Lao", "lo"),
+    ("Latin", "la"),
+    ("Latvian", "lv"),
+    ("Lithuanian", "lt"),
+    ("Luxembourgish", "lb"),
+    ("Macedonian", "mk"),
+    ("Malagasy", "mg"),
+    ("Malay", "ms"),
+    ("Malayalam", "ml"),
+    ("Maltese", "mt"),
+    ("Maori", "mi"),
+    ("Marathi", "mr"),
+    ("Mongolian", "mn"),
+    ("Myanmar (Burmese)", "my"),
+    ("Nepali", "ne"),
+    ("Norwegian", "no"),
+    ("Odia (Oriya)", "or"),
+    ("Pashto", "ps"),
+    ("Persian", "fa"),
+    ("Polish", "pl"),
+    ("Portuguese", "pt"),
+    ("Punjabi", "pa"),
+    ("Romanian", "ro"),
+    ("Russian", "ru"),
+    ("Samoan", "sm"),
+    ("Sanskrit", "sa"),
+    ("Scots Gaelic", "gd"),
+    ("Serbian", "sr"),
+    ("Sesotho", "st"),
+    ("Shona", "sn"),
+    ("Sindhi", "sd"),
+    ("Sinhala", "si"),
+    ("Slovak", "sk"),
+    ("Slovenian", "sl"),
+    ("Somali", "so"),
+    ("Spanish", "es"),
+    ("Sundanese", "su"),
+    ("Swahili", "sw"),
+    ("Swedish", "sv"),
+    ("Tajik", "tg"),
+    ("Tamil", "ta"),
+    ("Tatar", "tt"),
+    ("Telugu", "te"),
+    ("Thai", "th"),
+    ("Turkish", "tr"),
+    ("Turkmen", "tk"),
+    ("Ukrainian", "uk"),
+    ("Urdu", "ur"),
+    ("Uyghur", "ug"),
+    ("Uzbek", "uz"),
+    ("Vietnamese", "vi"),
+    ("Welsh", "cy"),
+    ("Xhosa", "xh"),
+    ("Yiddish", "yi"),
+    ("Yoruba", "yo"),
+    ("Zulu", "zu"),
+)
+
+# Language codes in order, and each code's name, for translating without unpacking per-language records
+LANG_CODES = tuple(code for _, code in LANGUAGES)
+LANG_NAME_BY_CODE = MappingProxyType({code: name for name, code in LANGUAGES})
 
 class Logger:
-    def __init__(self, console_level="info"):
+    def __init__(self, console_level="info", file_level="info"):
         os.makedirs(LOG_DIR, exist_ok=True)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.log_file = os.path.join(LOG_DIR, f"domainterm_{timestamp}.log")
+        # Keep one line-buffered handle open rather than reopening the file per entry
+        self.log_handle = open(self.log_file, 'a', encoding='utf-8', buffering=1)
+        atexit.register(self.log_handle.close)
         self.console_level = console_level
+        self.file_level = file_level
         self.level_priority = {"debug": 0, "info": 1, "error": 2}
 
+    def is_enabled(self, level: str) -> bool:
+        """Check whether a message at this level would be written to the file or console"""
+        priority = self.level_priority.get(level, 1)
+        return (priority >= self.level_priority.get(self.file_level, 1) or
+                priority >= self.level_priority.get(self.console_level, 1))
+
     def log(self, level: str, message: str, show_console: bool = None, **kwargs):
+        priority = self.level_priority.get(level, 1)
+        write_file = priority >= self.level_priority.get(self.file_level, 1)
+
+        # Console output logic
+        if show_console is None:
+            show_console = priority >= self.level_priority.get(self.console_level, 1)
+
+        # Skip formatting entirely when the entry would go nowhere
+        if not write_file and not show_console:
+            return
+
         timestamp = datetime.now().isoformat()
         log_entry = f'time="{timestamp}" level={level} msg="{message}"'
 
@@ -210,13 +284,8 @@ class Logger:
             else:
                 log_entry += f' {key}={value}'
 
-        # Always log to file
-        with open(self.log_file, 'a', encoding='utf-8') as f:
-            f.write(log_entry + '\n')
-
-        # Console output logic
-        if show_console is None:
-            show_console = self.level_priority.get(level, 1) >= self.level_priority.get(self.console_level, 1)
+        if write_file:
+            self.log_handle.write(log_entry + '\n')
 
         if show_console:
             print(log_entry)
@@ -230,85 +299,441 @@ class Logger:
     def debug(self, message: str, show_console: bool = None, **kwargs):
         self.log("debug", message, show_console, **kwargs)
 
-logger = Logger()
+logger = Logger(file_level=LOG_LEVEL)
+
+def load_json(raw: Union[bytes, str]) -> Any:
+    """Parse JSON bytes or text, using orjson when it is installed"""
+    if orjson:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def dump_json(data: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON, using orjson when it is installed"""
+    if orjson:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+# Default for cache lookups, since None and False are valid cached results
+_MISS = object()
+
+class CacheTable:
+    """Least-recently-used window onto one database cache.
+
+    Lookups that miss in memory fall back to the database, so memory stays
+    bounded by maxsize however large the cache grows on disk.
+    """
+
+    def __init__(self, db: "Database", name: str, maxsize: int = CACHE_MAXSIZE):
+        self.db = db
+        self.name = name
+        self.maxsize = maxsize
+        self.entries: OrderedDict[str, Any] = OrderedDict()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        entries = self.entries
+        value = entries.get(key, _MISS)
+        if value is not _MISS:
+            entries.move_to_end(key)
+            return value
+
+        value = self.db.lookup(self.name, key)
+        if value is _MISS:
+            return default
+        self.remember(key, value)
+        return value
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISS)
+        if value is _MISS:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISS) is not _MISS
+
+    def remember(self, key: str, value: Any):
+        """Keep an entry in memory, dropping the least recently used one when full"""
+        entries = self.entries
+        entries[key] = value
+        entries.move_to_end(key)
+        if len(entries) > self.maxsize:
+            # Unsaved entries stay reachable through Database.lookup until they are written
+            entries.popitem(last=False)
 
 class Database:
-    def __init__(self, filename: str):
+    """Cache store backed by SQLite, with recently used entries kept in memory.
+
+    Each cache entry is a row holding a JSON value, so persisting a change
+    writes only that row instead of rewriting every cache.
+    """
+
+    CACHE_NAMES = (
+        "translation_cache",
+        "webified_cache",
+        "whois_cache",
+        "search_evaluation_cache",
+        "ratings_cache",
+        "synonyms_cache",
+        "npm_cache",
+        "trademark_cache",
+        "social_cache",
+    )
+
+    def __init__(self, filename: str, legacy_filename: str = None):
         self.filename = filename
-        self.data = {
-            "translation_cache": {},
-            "webified_cache": {},
-            "whois_cache": {},
-            "search_evaluation_cache": {},
-            "ratings_cache": {},
-            "synonyms_cache": {},
-            "npm_cache": {},
-            "trademark_cache": {},
-            "social_cache": {}
-        }
-        self.load()
-
-    def load(self):
+        self.data = {name: CacheTable(self, name) for name in self.CACHE_NAMES}
+        self.changes: Dict[Tuple[str, str], Any] = {}  # (cache, key) -> value waiting to be written
+        self.writing: Dict[Tuple[str, str], Any] = {}  # changes handed to a background write that hasn't finished
+        self.flush_requested = asyncio.Event()
+        self.write_lock = threading.Lock()
+
+        # Writes happen in worker threads (one at a time, under write_lock)
+        self.conn = sqlite3.connect(filename, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("""CREATE TABLE IF NOT EXISTS cache_entries (
+            cache TEXT NOT NULL,
+            key TEXT NOT NULL,
+            value TEXT NOT NULL,
+            PRIMARY KEY (cache, key)
+        ) WITHOUT ROWID""")
+        # Reads use their own connection so WAL lets them proceed while a write is in progress
+        self.reader = sqlite3.connect(filename, check_same_thread=False)
+        # Saved entries per cache, counted once here and then kept up to date by write()
+        self.saved_counts: Dict[str, int] = dict(
+            self.reader.execute("SELECT cache, COUNT(*) FROM cache_entries GROUP BY cache"))
+        self.load(legacy_filename)
+
+    def load(self, legacy_filename: str = None):
         try:
-            if os.path.exists(self.filename):
-                with open(self.filename, 'r', encoding='utf-8') as f:
-                    saved_data = json.load(f)
-                    self.data.update(saved_data)
-                cache_stats = {key: len(cache) for key, cache in self.data.items()}
-                logger.info("Database loaded", show_console=False, file=self.filename, **cache_stats)
+            is_empty = self.reader.execute("SELECT 1 FROM cache_entries LIMIT 1").fetchone() is None
+            if is_empty and legacy_filename and os.path.exists(legacy_filename):
+                self.import_json(legacy_filename)
+
+            logger.info("Database loaded", show_console=False, file=self.filename, **self.counts())
         except Exception as e:
             logger.error("Failed to load database", error=str(e))
 
-    def save(self):
+    def import_json(self, filename: str):
+        """Copy caches from an older db.json file into this database"""
+        with open(filename, 'rb') as f:
+            saved_data = load_json(f.read())
+
+        entries_imported = 0
+        for cache, entries in saved_data.items():
+            if isinstance(entries, dict):
+                for key, value in entries.items():
+                    if self.is_legacy_failure(cache, value):
+                        continue  # Leave failed lookups uncached so they are retried
+                    self.set(cache, key, value)
+                    entries_imported += 1
+        self.flush()
+        logger.info("Imported legacy database", file=filename, entries=entries_imported)
+
+    @staticmethod
+    def is_legacy_failure(cache: str, value: Any) -> bool:
+        """Whether an entry from db.json is a placeholder the old code stored for a failed lookup"""
+        if cache == "whois_cache":
+            return value is None
+        if cache == "search_evaluation_cache":
+            return value == {"isAvailable": False, "confidence": 0}
+        return False
+
+    def table(self, cache: str) -> CacheTable:
+        table = self.data.get(cache)
+        if table is None:
+            table = self.data[cache] = CacheTable(self, cache)
+        return table
+
+    def lookup(self, cache: str, key: str) -> Any:
+        """Find an entry that isn't held in memory: unsaved changes first, then the database"""
+        value = self.changes.get((cache, key), _MISS)
+        if value is _MISS:
+            value = self.writing.get((cache, key), _MISS)
+        if value is _MISS:
+            row = self.reader.execute("SELECT value FROM cache_entries WHERE cache = ? AND key = ?",
+                                      (cache, key)).fetchone()
+            if row:
+                value = load_json(row[0])
+        return value
+
+    def items(self, cache: str):
+        """Iterate over the saved entries of a cache without loading them all into memory"""
+        for key, value in self.reader.execute("SELECT key, value FROM cache_entries WHERE cache = ?", (cache,)):
+            yield key, load_json(value)
+
+    def counts(self) -> Dict[str, int]:
+        """Number of saved entries in each cache"""
+        counts = dict.fromkeys(self.data, 0)
+        counts.update(self.saved_counts)
+        return counts
+
+    def set(self, cache: str, key: str, value: Any):
+        """Store a cache entry; it is written to disk by the next flush"""
+        self.table(cache).remember(key, value)
+        self.changes[(cache, key)] = value
+        if len(self.changes) >= DB_FLUSH_MAX_CHANGES:
+            self.flush_requested.set()
+
+    def take_changes(self) -> Dict[Tuple[str, str], Any]:
+        """Hand over the pending changes and start collecting new ones"""
+        self.flush_requested.clear()
+        changes, self.changes = self.changes, {}
+        return changes
+
+    def write(self, changes: Dict[Tuple[str, str], Any]) -> bool:
+        """Write changed entries in a single transaction, returning whether it succeeded"""
+        if not changes:
+            return True
         try:
-            with open(self.filename, 'w', encoding='utf-8') as f:
-                json.dump(self.data, f, indent=2, ensure_ascii=False)
+            rows = [(cache, key, dump_json(value).decode('utf-8')) for (cache, key), value in changes.items()]
+            added: Dict[str, int] = {}
+            with self.write_lock:
+                with self.conn:
+                    conn = self.conn
+                    for cache, key, value in rows:
+                        # Most changes are new keys, so try the insert first and count the ones that land
+                        before = conn.total_changes
+                        conn.execute("INSERT OR IGNORE INTO cache_entries (cache, key, value) VALUES (?, ?, ?)",
+                                     (cache, key, value))
+                        if conn.total_changes != before:
+                            added[cache] = added.get(cache, 0) + 1
+                        else:
+                            conn.execute("UPDATE cache_entries SET value = ? WHERE cache = ? AND key = ?",
+                                         (value, cache, key))
+                # Only count rows once they are committed
+                for cache, count in added.items():
+                    self.saved_counts[cache] = self.saved_counts.get(cache, 0) + count
+            return True
         except Exception as e:
-            logger.error("Failed to save database", error=str(e))
-
-def clean_word(word: str) -> str:
-    """Clean word by removing non-alphabetic characters and converting to lowercase"""
-    return re.sub(r'[^a-zA-Z]', '', word).lower()
-
-def unidecode_simple(text: str) -> str:
-    """Simple ASCII transliteration"""
-    if not text:
-        return ""
-
-    # Basic character mappings
-    char_map = {
-        'à': 'a', 'á': 'a', 'â': 'a', 'ã': 'a', 'ä': 'a', 'å': 'a',
-        'è': 'e', 'é': 'e', 'ê': 'e', 'ë': 'e',
-        'ì': 'i', 'í': 'i', 'î': 'i', 'ï': 'i',
-        'ò': 'o', 'ó': 'o', 'ô': 'o', 'õ': 'o', 'ö': 'o',
-        'ù': 'u', 'ú': 'u', 'û': 'u', 'ü': 'u',
-        'ñ': 'n', 'ç': 'c',
-        'ß': 'ss',
-        'æ': 'ae', 'œ': 'oe',
-    }
-
-    result = ""
-    for char in text.lower():
-        if char in char_map:
-            result += char_map[char]
-        elif ord(char) < 128:  # ASCII
-            result += char
-        # Skip non-ASCII characters not in mapping
+            logger.error("Failed to save database", error=str(e), entries=len(changes))
+            return False
+
+    def restore_changes(self, changes: Dict[Tuple[str, str], Any]):
+        """Put back changes that failed to write so the next flush retries them"""
+        for entry, value in changes.items():
+            # Values set since the failed write are newer, so they win
+            self.changes.setdefault(entry, value)
+
+    def flush(self):
+        """Write any pending changes"""
+        changes = self.take_changes()
+        if not self.write(changes):
+            self.restore_changes(changes)
+
+    async def flush_in_background(self):
+        """Like flush(), but encode and write in a worker thread so the event loop keeps running"""
+        # Cache values are always replaced, never mutated in place, so the thread sees a consistent set
+        changes = self.take_changes()
+        if changes:
+            # Keep the changes visible to lookup() until they are on disk
+            self.writing = changes
+            written = False
+            try:
+                written = await asyncio.to_thread(self.write, changes)
+            finally:
+                if not written:
+                    self.restore_changes(changes)
+                self.writing = {}
+
+# Basic character mappings for ASCII transliteration
+TRANSLITERATION_TABLE = str.maketrans({
+    'à': 'a', 'á': 'a', 'â': 'a', 'ã': 'a', 'ä': 'a', 'å': 'a',
+    'è': 'e', 'é': 'e', 'ê': 'e', 'ë': 'e',
+    'ì': 'i', 'í': 'i', 'î': 'i', 'ï': 'i',
+    'ò': 'o', 'ó': 'o', 'ô': 'o', 'õ': 'o', 'ö': 'o',
+    'ù': 'u', 'ú': 'u', 'û': 'u', 'ü': 'u',
+    'ñ': 'n', 'ç': 'c',
+    'ß': 'ss',
+    'æ': 'ae', 'œ': 'oe',
+})
+NON_ALPHA_PATTERN = re.compile(r'[^a-zA-Z]')
+
+def clean_and_transliterate(text: str) -> str:
+    """Transliterate to ASCII and keep only lowercase letters"""
+    # Non-ASCII leftovers are non-alphabetic too, so one substitution drops them along with everything else
+    return NON_ALPHA_PATTERN.sub('', text.lower().translate(TRANSLITERATION_TABLE))
+
+# Same User-Agent urllib sends by default
+HTTP_USER_AGENT = f"Python-urllib/{sys.version_info[0]}.{sys.version_info[1]}"
+HTTP_MAX_REDIRECTS = 5
+
+class ConnectionPool:
+    """Thread-safe pool of idle keep-alive connections, so repeat requests to a host skip the TCP/TLS handshake"""
+
+    def __init__(self, max_idle_per_host: int = 8):
+        self.max_idle_per_host = max_idle_per_host
+        self.ssl_context = ssl.create_default_context()
+        self.idle: Dict[Tuple[str, str, int], List[http.client.HTTPConnection]] = {}
+        self.lock = threading.Lock()
+        # Proxies from HTTP(S)_PROXY / NO_PROXY, read once like urlopen's ProxyHandler does
+        self.proxies = urllib.request.getproxies()
+        self.proxy_routes: Dict[Tuple[str, str, int], Optional[Tuple[str, int, Dict[str, str]]]] = {}
+
+    def proxy(self, key: Tuple[str, str, int]) -> Optional[Tuple[str, int, Dict[str, str]]]:
+        """Return the (host, port, headers) of the proxy for (scheme, host, port), or None to connect directly"""
+        route = self.proxy_routes.get(key, _MISS)
+        if route is _MISS:
+            scheme, host, _ = key
+            proxy_url = self.proxies.get(scheme)
+            route = None
+            if proxy_url and not urllib.request.proxy_bypass(host):
+                parts = urllib.parse.urlsplit(proxy_url if "://" in proxy_url else f"http://{proxy_url}")
+                headers = {}
+                if parts.username:
+                    credentials = f"{urllib.parse.unquote(parts.username)}:{urllib.parse.unquote(parts.password or '')}"
+                    headers["Proxy-Authorization"] = "Basic " + base64.b64encode(credentials.encode()).decode("ascii")
+                route = (parts.hostname, parts.port or 80, headers)
+            self.proxy_routes[key] = route
+        return route
+
+    def acquire(self, key: Tuple[str, str, int], timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        """Return an idle connection for (scheme, host, port) or a new one, and whether it was reused"""
+        with self.lock:
+            connections = self.idle.get(key)
+            if connections:
+                conn = connections.pop()
+                conn.timeout = timeout
+                if conn.sock:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+
+        scheme, host, port = key
+        proxy = self.proxy(key)
+        if proxy:
+            proxy_host, proxy_port, proxy_headers = proxy
+            if scheme == "https":
+                # Tunnel through the proxy with CONNECT; TLS is still negotiated with the target host
+                conn = http.client.HTTPSConnection(proxy_host, proxy_port, timeout=timeout, context=self.ssl_context)
+                conn.set_tunnel(host, port, headers=proxy_headers)
+                return conn, False
+            return http.client.HTTPConnection(proxy_host, proxy_port, timeout=timeout), False
+
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=timeout, context=self.ssl_context), False
+        return http.client.HTTPConnection(host, port, timeout=timeout), False
+
+    def release(self, key: Tuple[str, str, int], conn: http.client.HTTPConnection):
+        """Return a connection to the pool once its response has been fully read"""
+        with self.lock:
+            connections = self.idle.setdefault(key, [])
+            if len(connections) < self.max_idle_per_host:
+                connections.append(conn)
+                return
+        conn.close()
+
+    def close(self):
+        """Close all idle connections"""
+        with self.lock:
+            idle, self.idle = self.idle, {}
+        for connections in idle.values():
+            for conn in connections:
+                conn.close()
+
+# Enough idle connections per host to keep a full round of parallel translations warm
+http_pool = ConnectionPool(max_idle_per_host=TRANSLATION_CONCURRENCY)
+
+# Cap outbound requests across all stages so parallel fan-out can't exhaust sockets or file descriptors
+http_semaphore = asyncio.Semaphore(HTTP_CONCURRENCY)
+http_executor = ThreadPoolExecutor(max_workers=HTTP_CONCURRENCY, thread_name_prefix="http")
+
+# Per-service caps on requests in flight, within the global HTTP_CONCURRENCY
+whois_semaphore = asyncio.Semaphore(WHOIS_CONCURRENCY)
+search_semaphore = asyncio.Semaphore(SEARCH_CONCURRENCY)
+npm_semaphore = asyncio.Semaphore(NPM_CONCURRENCY)
+social_semaphore = asyncio.Semaphore(SOCIAL_CONCURRENCY)
+
+class RateLimiter:
+    """Spaces out request starts so a service sees at most one request per interval"""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.next_start = 0.0
+
+    async def wait(self):
+        """Wait for this caller's turn; call it while holding the service's semaphore"""
+        now = asyncio.get_running_loop().time()
+        # Claim the next free slot before sleeping, so concurrent callers queue up behind each other
+        start = max(now, self.next_start)
+        self.next_start = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+# Rate limits for services with a quota; the semaphores cap requests in flight, these cap how often they start
+whois_limiter = RateLimiter(WHOIS_INTERVAL)
+search_limiter = RateLimiter(SEARCH_INTERVAL)
+
+def _send_request(url: str, method: str, headers: Dict, data: Optional[bytes], timeout: float) -> Tuple[int, Optional[str], bytes]:
+    """Send one request over a pooled connection and return its status, Location header and body"""
+    parts = urllib.parse.urlsplit(url)
+    key = (parts.scheme, parts.hostname, parts.port or (443 if parts.scheme == "https" else 80))
+    path = parts.path or "/"
+    if parts.query:
+        path += f"?{parts.query}"
+
+    proxy = http_pool.proxy(key)
+    if proxy and parts.scheme == "http":
+        # Plain HTTP proxies take the full URL, and credentials with every request
+        path = f"{parts.scheme}://{parts.netloc}{path}"
+        headers = {**headers, **proxy[2]}
+
+    while True:
+        conn, reused = http_pool.acquire(key, timeout)
+        try:
+            conn.request(method, path, body=data, headers=headers)
+            response = conn.getresponse()
+            body = response.read()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            conn.close()
+            if reused:
+                continue  # The server closed the idle connection; retry on a fresh one
+            raise
+        except Exception:
+            conn.close()
+            raise
 
-    return result
+        if response.will_close:
+            conn.close()
+        else:
+            http_pool.release(key, conn)
+        return response.status, response.getheader("Location"), body
+
+def _urlopen(url: str, method: str, headers: Optional[Dict], data: Optional[bytes], timeout: float) -> Tuple[int, bytes]:
+    """Blocking HTTP request returning the status code and body, including for error statuses"""
+    headers = {"User-Agent": HTTP_USER_AGENT, **(headers or {})}
+
+    for _ in range(HTTP_MAX_REDIRECTS + 1):
+        status, location, body = _send_request(url, method, headers, data, timeout)
+        # Follow redirects like urlopen did, but only for requests that are safe to repeat
+        if status not in (301, 302, 303, 307, 308) or not location or method not in ("GET", "HEAD"):
+            return status, body
+        url = urllib.parse.urljoin(url, location)
+
+    return status, body
+
+async def fetch(url: str, method: str = "GET", headers: Dict = None, data: bytes = None, timeout: float = 30) -> Tuple[int, bytes]:
+    """Run an HTTP request in a worker thread so the event loop is never blocked"""
+    async with http_semaphore:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(http_executor, _urlopen, url, method, headers, data, timeout)
+
+async def probe_status(url: str, timeout: float = 10) -> int:
+    """Get the status code for a URL without downloading its body"""
+    status, _ = await fetch(url, "HEAD", timeout=timeout)
+    if status in (405, 501):
+        # Some servers reject HEAD; fall back to a GET for a single byte
+        status, _ = await fetch(url, headers={"Range": "bytes=0-0"}, timeout=timeout)
+    return status
 
 async def http_request(url: str, method: str = "GET", headers: Dict = None, data: bytes = None) -> Optional[Dict]:
     """Simple HTTP request function"""
     try:
-        req = urllib.request.Request(url, data=data, method=method)
-
-        if headers:
-            for key, value in headers.items():
-                req.add_header(key, value)
+        status, body = await fetch(url, method, headers, data)
+        if status >= 400:
+            logger.debug("HTTP request failed", url=url, status_code=status)
+            return None
 
-        with urllib.request.urlopen(req, timeout=30) as response:
-            content = response.read().decode('utf-8')
-            return json.loads(content)
+        return load_json(body)
 
     except Exception as e:
         logger.debug("HTTP request failed", url=url, error=str(e))
@@ -320,49 +745,74 @@ async def translate_word(word: str, language_code: str) -> Optional[Dict]:
         encoded_word = urllib.parse.quote(word)
         url = f"https://translate.google.com/translate_a/single?client=gtx&sl=en&tl={language_code}&dt=t&q={encoded_word}"
 
-        req = urllib.request.Request(url)
-        with urllib.request.urlopen(req, timeout=10) as response:
-            data = json.loads(response.read().decode('utf-8'))
-            return data
+        status, body = await fetch(url, timeout=10)
+        if status >= 400:
+            logger.debug("Translation failed", word=word, lang=language_code, status_code=status)
+            return None
+
+        return load_json(body)
 
     except Exception as e:
         logger.debug("Translation failed", word=word, lang=language_code, error=str(e))
         return None
 
-async def get_translations(word: str) -> List[Dict]:
-    """Get translations for a word in multiple languages"""
-    logger.info("Getting translations", show_console=False, word=word)
-    translations = []
+async def get_translations(word: str, language_codes: Sequence[str] = LANG_CODES) -> Dict[str, Optional[Dict]]:
+    """Get translations for a word in multiple languages, keyed by language code.
+
+    Languages whose translation cleans down to nothing map to None; languages whose
+    request failed are left out so a later run can retry just those.
+    """
+    logger.info("Getting translations", show_console=False, word=word, languages=len(language_codes))
+    translations = {}
     successful_langs = []
     failed_langs = []
+    cleaned_word = clean_and_transliterate(word)
+
+    semaphore = asyncio.Semaphore(TRANSLATION_CONCURRENCY)
 
-    for language in LANGUAGES:
+    async def translate(language_code):
+        async with semaphore:
+            return await translate_word(word, language_code)
+
+    # Fire all languages at once; the semaphore keeps Google from being flooded
+    responses = await asyncio.gather(*(translate(code) for code in language_codes), return_exceptions=True)
+
+    for code, response in zip(language_codes, responses):
+        name = LANG_NAME_BY_CODE[code]
         try:
-            response = await translate_word(word, language["code"])
-            if response and response[0] and response[0][0] and response[0][0][0]:
+            if isinstance(response, Exception):
+                raise response
+
+            if response is None:
+                failed_langs.append(name)
+                continue
+
+            translations[code] = None
+            if response[0] and response[0][0] and response[0][0][0]:
                 translated_text = response[0][0][0]
 
                 translation = {
-                    "word": clean_word(unidecode_simple(word)),
-                    "language": language,
+                    "word": cleaned_word,
+                    "language": {"name": name, "code": code},
                     "translation": {
                         "raw": translated_text,
-                        "cleaned": clean_word(unidecode_simple(translated_text))
+                        "cleaned": clean_and_transliterate(translated_text)
                     }
                 }
 
                 if translation["translation"]["cleaned"]:
-                    translations.append(translation)
-                    successful_langs.append(language["name"])
-                    logger.debug("Translation success", show_console=False, word=word, lang=language["name"],
+                    translations[code] = translation
+                    successful_langs.append(name)
+                    logger.debug("Translation success", show_console=False, word=word, lang=name,
                                original=translated_text, cleaned=translation["translation"]["cleaned"])
 
         except Exception as e:
-            failed_langs.append(language["name"])
-            logger.debug("Translation error", show_console=False, word=word, lang=language["name"], error=str(e))
+            translations.pop(code, None)
+            failed_langs.append(name)
+            logger.debug("Translation error", show_console=False, word=word, lang=name, error=str(e))
             continue
 
-    logger.info("Translation complete", show_console=False, word=word, total_translations=len(translations),
+    logger.info("Translation complete", show_console=False, word=word, total_translations=len(successful_langs),
                successful_languages=len(successful_langs), failed_languages=len(failed_langs))
 
     if successful_langs:
@@ -381,13 +831,7 @@ async def llm_request(messages: List[Dict], response_format: Dict = None) -> Opt
         if response_format:
             payload["response_format"] = response_format
 
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {LLM_API_KEY}"
-        }
-
-        data = json.dumps(payload).encode('utf-8')
-        response = await http_request(f"{LLM_BASE_URL}/chat/completions", "POST", headers, data)
+        response = await http_request(LLM_CHAT_URL, "POST", LLM_HEADERS, dump_json(payload))
 
         if response and "choices" in response and response["choices"]:
             content = response["choices"][0]["message"]["content"]
@@ -432,7 +876,7 @@ word: {cleaned_word}"""
         return []
 
     try:
-        webified_list = json.loads(response.lower())
+        webified_list = load_json(response.lower())
         filtered_list = [w for w in webified_list if w and isinstance(w, str) and " " not in w]
         logger.info("Webification complete", show_console=False, word=cleaned_word,
                    generated_count=len(webified_list), filtered_count=len(filtered_list),
@@ -442,6 +886,56 @@ word: {cleaned_word}"""
         logger.error("Webification parsing failed", word=cleaned_word, error=str(e), raw_response=response)
         return []
 
+async def get_webified_words_batch(translations: List[Dict]) -> Dict[str, List[str]]:
+    """Generate webified versions of several words with a single LLM request, keyed by cleaned word"""
+    if len(translations) == 1:
+        return {translations[0]["translation"]["cleaned"]: await get_webified_words(translations[0])}
+
+    translations_by_word = {translation["translation"]["cleaned"]: translation for translation in translations}
+    words = list(translations_by_word)
+    logger.info("Webifying words batch", show_console=False, words=", ".join(words))
+
+    messages = [{
+        "role": "user",
+        "content": f"""Convert each of the following words into a list of Web 2.0 style SaaS names by removing a single vowel each time. Return the output as a JSON object that maps each word to a JS string array of its names. Do not output any text other than the object
+
+words: {", ".join(words)}"""
+    }]
+
+    response_format = {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "webified",
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": {word: {"type": "array", "items": {"type": "string"}} for word in words},
+                "required": words
+            }
+        }
+    }
+
+    response = await llm_request(messages, response_format)
+
+    results = {}
+    try:
+        webified_by_word = load_json(response) if response else {}
+        for word in words:
+            webified_list = webified_by_word.get(word)
+            if isinstance(webified_list, list):
+                results[word] = [w.lower() for w in webified_list if w and isinstance(w, str) and " " not in w]
+    except Exception as e:
+        logger.error("Webification batch parsing failed", words=", ".join(words), error=str(e), raw_response=response)
+
+    logger.info("Webification batch complete", show_console=False, word_count=len(words), answered_count=len(results))
+
+    # Anything the batch didn't answer falls back to a single-word request
+    for word in words:
+        if word not in results:
+            results[word] = await get_webified_words(translations_by_word[word])
+
+    return results
+
 async def get_synonyms(word: str) -> List[str]:
     """Get synonyms for a word"""
     logger.info("Getting synonyms", show_console=False, word=word)
@@ -472,7 +966,7 @@ word: {word}"""
         return []
 
     try:
-        synonyms_list = json.loads(response.lower())
+        synonyms_list = load_json(response.lower())
         filtered_list = [s for s in synonyms_list if s and isinstance(s, str) and " " not in s]
         logger.info("Synonym lookup complete", show_console=False, word=word,
                    generated_count=len(synonyms_list), filtered_count=len(filtered_list),
@@ -482,6 +976,54 @@ word: {word}"""
         logger.error("Synonym parsing failed", word=word, error=str(e), raw_response=response)
         return []
 
+async def get_synonyms_batch(words: List[str]) -> Dict[str, List[str]]:
+    """Get synonyms for several words with a single LLM request"""
+    if len(words) == 1:
+        return {words[0]: await get_synonyms(words[0])}
+
+    logger.info("Getting synonyms batch", show_console=False, words=", ".join(words))
+
+    messages = [{
+        "role": "user",
+        "content": f"""Find synonyms for each of the provided words. Provide at least 10 synonyms per word. Return the output as a JSON object that maps each word to a JS string array of its synonyms. Do not output any text other than the object
+
+words: {", ".join(words)}"""
+    }]
+
+    response_format = {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "synonyms",
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": {word: {"type": "array", "items": {"type": "string"}} for word in words},
+                "required": words
+            }
+        }
+    }
+
+    response = await llm_request(messages, response_format)
+
+    results = {}
+    try:
+        synonyms_by_word = load_json(response) if response else {}
+        for word in words:
+            synonyms_list = synonyms_by_word.get(word)
+            if isinstance(synonyms_list, list):
+                results[word] = [s.lower() for s in synonyms_list if s and isinstance(s, str) and " " not in s]
+    except Exception as e:
+        logger.error("Synonym batch parsing failed", words=", ".join(words), error=str(e), raw_response=response)
+
+    logger.info("Synonym batch complete", show_console=False, word_count=len(words), answered_count=len(results))
+
+    # Anything the batch didn't answer falls back to a single-word request
+    for word in words:
+        if word not in results:
+            results[word] = await get_synonyms(word)
+
+    return results
+
 async def rate_name(word: str) -> float:
     """Rate a name for business potential"""
     logger.info("Rating name", show_console=False, word=word)
@@ -513,7 +1055,7 @@ word: {word}"""
         return -1
 
     try:
-        rating_data = json.loads(response)
+        rating_data = load_json(response)
         rating = float(rating_data.get("rating", -1))
         logger.info("Name rating complete", show_console=False, word=word, rating=rating)
         return rating
@@ -521,15 +1063,67 @@ word: {word}"""
         logger.error("Rating parsing failed", word=word, error=str(e), raw_response=response)
         return -1
 
-async def check_dns_availability(domain: str) -> bool:
-    """Check if domain resolves via DNS"""
+async def rate_names_batch(words: List[str]) -> Dict[str, float]:
+    """Rate several names with a single LLM request"""
+    if len(words) == 1:
+        return {words[0]: await rate_name(words[0])}
+
+    logger.info("Rating names batch", show_console=False, words=", ".join(words))
+
+    messages = [{
+        "role": "user",
+        "content": f"""Given the following words, rate each word's potential for a good product/business name. This should include how easy it would be to pronounce for an english speaker and how easy it would be to spell. Output a JSON object that maps each word to its rating, a number between 0 and 100 where 0 is bad and 100 is good.
+
+words: {", ".join(words)}"""
+    }]
+
+    response_format = {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "ratings",
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": {word: {"type": "number"} for word in words},
+                "required": words
+            }
+        }
+    }
+
+    response = await llm_request(messages, response_format)
+
+    results = {}
+    try:
+        ratings_by_word = load_json(response) if response else {}
+        for word in words:
+            if isinstance(ratings_by_word.get(word), (int, float)):
+                results[word] = float(ratings_by_word[word])
+    except Exception as e:
+        logger.error("Rating batch parsing failed", words=", ".join(words), error=str(e), raw_response=response)
+
+    logger.info("Name rating batch complete", show_console=False, word_count=len(words), answered_count=len(results))
+
+    # Anything the batch didn't answer falls back to a single-word request
+    for word in words:
+        if word not in results:
+            results[word] = await rate_name(word)
+
+    return results
+
+async def check_dns_availability(domain: str) -> Optional[bool]:
+    """Check if domain resolves via DNS, or None if it can't be looked up at all"""
     try:
-        socket.gethostbyname(domain)
+        # getaddrinfo runs in the loop's thread pool, unlike the blocking gethostbyname
+        await asyncio.get_running_loop().getaddrinfo(domain, None, family=socket.AF_INET)
         logger.debug("DNS check", domain=domain, result="taken", reason="resolves")
         return False  # Domain exists
     except socket.gaierror:
         logger.debug("DNS check", domain=domain, result="available", reason="no_resolution")
         return True  # Domain doesn't exist
+    except UnicodeError as e:
+        # Malformed names (empty labels like "pa..y.com") fail IDNA encoding before any lookup
+        logger.debug("DNS check", domain=domain, result="failed", reason="invalid_name", error=str(e))
+        return None
 
 async def check_whois_availability(domain: str) -> Optional[bool]:
     """Check domain availability using Cloudflare WHOIS API"""
@@ -542,7 +1136,9 @@ async def check_whois_availability(domain: str) -> Optional[bool]:
         url = f"https://api.cloudflare.com/client/v4/accounts/{CLOUDFLARE_ACCOUNT_ID}/intel/whois?domain={domain}"
 
         logger.debug("WHOIS API request", domain=domain)
-        response = await http_request(url, headers=headers)
+        async with whois_semaphore:
+            await whois_limiter.wait()
+            response = await http_request(url, headers=headers)
 
         if not response:
             logger.error("WHOIS API request failed", domain=domain, reason="no_response")
@@ -563,29 +1159,40 @@ async def check_whois_availability(domain: str) -> Optional[bool]:
         logger.error("WHOIS check failed", domain=domain, error=str(e))
         return None
 
-async def check_domain_availability(word: str) -> Optional[bool]:
-    """Check if domain is available using DNS and WHOIS"""
-    if isinstance(word, list):
-        word = "".join(word)
-
-    domain = f"{word.replace(' ', '')}.com"
-    logger.info("Checking domain availability", show_console=False, word=word, domain=domain)
+async def check_domains_availability(words: List[str]) -> Dict[str, Optional[bool]]:
+    """Check several domains at once, resolving DNS for all of them concurrently.
+
+    Cloudflare's WHOIS API has no bulk endpoint, so domains that don't resolve are
+    confirmed with one request each, up to WHOIS_CONCURRENCY at a time.
+    """
+    domains = {word: f"{word.replace(' ', '')}.com" for word in words}
+    logger.info("Checking domain availability batch", show_console=False, word_count=len(domains))
+
+    # DNS lookups are cheap and unthrottled; they rule out most taken names without touching WHOIS
+    dns_results = await asyncio.gather(*(check_dns_availability(domain) for domain in domains.values()))
+
+    results = {}
+    whois_words = []
+    for (word, domain), dns_available in zip(domains.items(), dns_results):
+        if dns_available is None:
+            results[word] = None
+        elif dns_available:
+            whois_words.append(word)
+        else:
+            logger.info("Domain check complete", show_console=False, word=word, domain=domain,
+                       available=False, method="dns", reason="domain_resolves")
+            results[word] = False
 
-    # First check DNS (faster)
-    dns_available = await check_dns_availability(domain)
-    if not dns_available:
-        logger.info("Domain check complete", show_console=False, word=word, domain=domain,
-                   available=False, method="dns", reason="domain_resolves")
-        return False
+    whois_results = await asyncio.gather(*(check_whois_availability(domains[word]) for word in whois_words))
+    for word, whois_result in zip(whois_words, whois_results):
+        logger.info("Domain check complete", show_console=False, word=word, domain=domains[word],
+                   available=whois_result, dns_available=True, whois_available=whois_result)
+        results[word] = whois_result
 
-    # Then check WHOIS for confirmation
-    whois_result = await check_whois_availability(domain)
-    logger.info("Domain check complete", show_console=False, word=word, domain=domain,
-               available=whois_result, dns_available=True, whois_available=whois_result)
-    return whois_result
+    return results
 
-async def check_search_results(word: str) -> Dict:
-    """Check search results to determine if name is taken"""
+async def check_search_results(word: str) -> Optional[Dict]:
+    """Check search results to determine if name is taken, or None if the check failed"""
     logger.info("Checking search results", word=word)
 
     try:
@@ -594,10 +1201,14 @@ async def check_search_results(word: str) -> Dict:
         url = f"https://search.brave.com/search?q={encoded_word}"
 
         logger.debug("Fetching search results", word=word, search_url=url)
-        req = urllib.request.Request(url)
-        with urllib.request.urlopen(req, timeout=15) as response:
-            search_results = response.read().decode('utf-8')
+        async with search_semaphore:
+            await search_limiter.wait()
+            status, body = await fetch(url, timeout=15)
+        if status >= 400:
+            logger.error("Search check failed", word=word, status_code=status)
+            return None
 
+        search_results = body.decode('utf-8')
         logger.debug("Search results fetched", word=word, content_length=len(search_results))
 
         # Analyze with LLM
@@ -629,18 +1240,18 @@ search results: {search_results[:5000]}"""  # Limit search results length
         response = await llm_request(messages, response_format)
 
         if response:
-            result = json.loads(response)
+            result = load_json(response)
             logger.info("Search evaluation complete", word=word,
                        available=result.get("isAvailable"),
                        confidence=result.get("confidence"))
             return result
 
         logger.error("Search evaluation failed", word=word, reason="no_llm_response")
-        return {"isAvailable": False, "confidence": 0}
+        return None
 
     except Exception as e:
         logger.error("Search check failed", word=word, error=str(e))
-        return {"isAvailable": False, "confidence": 0}
+        return None
 
 async def check_npm_availability(word: str) -> bool:
     """Check if NPM package name is available"""
@@ -648,25 +1259,19 @@ async def check_npm_availability(word: str) -> bool:
 
     try:
         url = f"https://registry.npmjs.org/{word}"
-        req = urllib.request.Request(url)
+        async with npm_semaphore:
+            status = await probe_status(url)
 
-        with urllib.request.urlopen(req, timeout=10) as response:
-            available = response.status == 404
-            logger.info("NPM check complete", word=word, available=available,
-                       status_code=response.status)
-            return available
-
-    except urllib.error.HTTPError as e:
-        available = e.code == 404
-        logger.info("NPM check complete", word=word, available=available,
-                   status_code=e.code)
+        available = status == 404
+        logger.info("NPM check complete", word=word, available=available, status_code=status)
         return available
+
     except Exception as e:
         logger.error("NPM check failed", word=word, error=str(e))
         return False  # Assume taken if error
 
 async def check_social_availability(word: str) -> Dict[str, bool]:
-    """Check social media availability using sherlock-like approach"""
+    """Check social media handle availability by probing each platform's profile URL"""
     logger.info("Checking social media availability", word=word)
 
     social_platforms = {
@@ -676,25 +1281,22 @@ async def check_social_availability(word: str) -> Dict[str, bool]:
         "linkedin": f"https://linkedin.com/in/{word}",
     }
 
-    availability = {}
-
-    for platform, url in social_platforms.items():
+    async def check_platform(platform: str, url: str) -> bool:
         try:
             logger.debug("Checking social platform", word=word, platform=platform, url=url)
-            req = urllib.request.Request(url)
-            with urllib.request.urlopen(req, timeout=10) as response:
-                available = response.status == 404
-                availability[platform] = available
-                logger.debug("Social platform check", word=word, platform=platform,
-                           available=available, status_code=response.status)
-        except urllib.error.HTTPError as e:
-            available = e.code == 404
-            availability[platform] = available
+            status = await probe_status(url)
+            available = status == 404
             logger.debug("Social platform check", word=word, platform=platform,
-                        available=available, status_code=e.code)
+                        available=available, status_code=status)
+            return available
         except Exception as e:
-            availability[platform] = False
             logger.debug("Social platform check failed", word=word, platform=platform, error=str(e))
+            return False
+
+    # Probe all platforms at once; each check handles its own errors
+    async with social_semaphore:
+        results = await asyncio.gather(*(check_platform(platform, url) for platform, url in social_platforms.items()))
+    availability = dict(zip(social_platforms, results))
 
     available_count = sum(1 for avail in availability.values() if avail)
     logger.info("Social media check complete", word=word,
@@ -703,25 +1305,110 @@ async def check_social_availability(word: str) -> Dict[str, bool]:
 
     return availability
 
+class WorkQueue:
+    """FIFO work queue that ignores items already waiting in it or still being processed"""
+
+    def __init__(self, key: Callable[[Any], Any] = None, maxsize: int = QUEUE_MAXSIZE):
+        self.queue = asyncio.Queue(maxsize)
+        self.key = key or (lambda item: item)
+        self.pending = set()  # keys queued or taken but not yet marked done
+
+    def __len__(self):
+        return self.queue.qsize()
+
+    async def add(self, item):
+        """Enqueue an item unless one with the same key is queued or being processed.
+
+        If the queue is full, waits up to QUEUE_PUT_TIMEOUT for room and then drops the item.
+        """
+        key = self.key(item)
+        if key in self.pending:
+            return
+        self.pending.add(key)
+        try:
+            self.queue.put_nowait(item)
+        except asyncio.QueueFull:
+            try:
+                await asyncio.wait_for(self.queue.put(item), QUEUE_PUT_TIMEOUT)
+            except asyncio.TimeoutError:
+                self.pending.discard(key)
+                logger.error("Queue full - dropping item", show_console=False, key=key, queue_size=len(self))
+
+    def done(self, item):
+        """Mark a taken item as processed, so it can be queued again"""
+        self.pending.discard(self.key(item))
+
+    async def get(self):
+        """Wait for the next item"""
+        return await self.queue.get()
+
+    async def get_batch(self, max_items: int, max_wait: float = 0) -> List:
+        """Wait for the next item, then give up to max_wait seconds for more to arrive and take up to max_items"""
+        items = [await self.get()]
+        if max_wait and len(self) < max_items - 1:
+            await asyncio.sleep(max_wait)
+        while len(items) < max_items and not self.queue.empty():
+            items.append(self.queue.get_nowait())
+        return items
+
+class Stage(NamedTuple):
+    """A pipeline stage: where its work comes from and how its workers consume it"""
+    queue: WorkQueue
+    handler: Callable[[Any], Awaitable[bool]]  # returns True if it made an uncached request
+    workers: int = 1
+    batch_size: int = 0  # 0 hands the handler one item at a time
+    interval: float = 0  # pause after each uncached request
+
 class DomainTerm:
     def __init__(self, min_length: int = 3, max_length: int = 10):
         self.min_length = min_length
         self.max_length = max_length
-        self.db = Database(DB_FILE)
+        self.db = Database(DB_FILE, LEGACY_DB_FILE)
         self.base_word_cache = set()
+        self.base_words_mtime = None
+
+        # The cache tables live as long as the database, so handlers can hold on to them directly
+        self.translation_cache = self.db.data["translation_cache"]
+        self.webified_cache = self.db.data["webified_cache"]
+        self.whois_cache = self.db.data["whois_cache"]
+        self.search_evaluation_cache = self.db.data["search_evaluation_cache"]
+        self.ratings_cache = self.db.data["ratings_cache"]
+        self.synonyms_cache = self.db.data["synonyms_cache"]
+        self.npm_cache = self.db.data["npm_cache"]
+        self.social_cache = self.db.data["social_cache"]
+
+        # Running totals for status reports, counted once here and then kept up to date as results arrive
+        self.available_domains = sum(1 for _, available in self.db.items("whois_cache") if available)
+        self.rated_domains = sum(1 for word, _ in self.db.items("ratings_cache") if self.whois_cache.get(word))
 
         # Queues
-        self.translation_queue = set()
-        self.webification_queue = set()
-        self.synonym_queue = set()
-        self.whois_queue = set()
-        self.search_queue = set()
-        self.rating_queue = set()
-        self.npm_queue = set()
-        self.social_queue = set()
+        self.translation_queue = WorkQueue()
+        self.webification_queue = WorkQueue(key=lambda translation: translation["translation"]["cleaned"])
+        self.synonym_queue = WorkQueue()
+        self.whois_queue = WorkQueue()
+        self.available_queue = WorkQueue()
+        self.search_queue = WorkQueue()
+        self.rating_queue = WorkQueue()
+
+        # Stages run by stage_worker, in pipeline order
+        self.stages: Dict[str, Stage] = {
+            "translations": Stage(self.translation_queue, self.handle_translation, interval=TRANSLATION_INTERVAL),
+            "synonyms": Stage(self.synonym_queue, self.handle_synonyms, workers=LLM_WORKERS, batch_size=LLM_BATCH_SIZE),
+            "webifications": Stage(self.webification_queue, self.handle_webifications, workers=LLM_WORKERS,
+                                   batch_size=LLM_BATCH_SIZE),
+            "whois": Stage(self.whois_queue, self.handle_whois, batch_size=WHOIS_BATCH_SIZE),
+            "available": Stage(self.available_queue, self.handle_available_domain, workers=AVAILABLE_WORKERS),
+            # Search is paced far slower than NPM and social checks, so it gets its own queue rather than holding theirs up
+            "search": Stage(self.search_queue, self.evaluate_search, workers=SEARCH_CONCURRENCY),
+            "ratings": Stage(self.rating_queue, self.handle_ratings, workers=LLM_WORKERS, batch_size=LLM_BATCH_SIZE),
+        }
 
         self.running = True
 
+    def _acceptable(self, word: str) -> bool:
+        """Whether a word is worth a domain check: non-empty and within the configured length range"""
+        return bool(word) and self.min_length <= len(word) <= self.max_length
+
     async def load_base_words(self):
         """Load base words from file"""
         if not os.path.exists(BASE_WORDS_FILE):
@@ -730,6 +1417,12 @@ class DomainTerm:
             sys.exit(1)
 
         try:
+            # Nothing to do if the file hasn't been touched since the last load
+            mtime = os.stat(BASE_WORDS_FILE).st_mtime_ns
+            if mtime == self.base_words_mtime:
+                return
+            self.base_words_mtime = mtime
+
             with open(BASE_WORDS_FILE, 'r', encoding='utf-8') as f:
                 words = [line.strip() for line in f if line.strip()]
 
@@ -737,10 +1430,11 @@ class DomainTerm:
 
             for word in new_words:
                 self.base_word_cache.add(word)
-                self.translation_queue.add(word)
-                self.whois_queue.add(word)
-                self.synonym_queue.add(word)
-                logger.info("Added base word to queues", word=word)
+                await self.translation_queue.add(word)
+                if self._acceptable(word):
+                    await self.whois_queue.add(word)
+                await self.synonym_queue.add(word)
+                logger.debug("Added base word to queues", word=word)
 
             if new_words:
                 logger.info("Base words file processed", total_words=len(words),
@@ -749,283 +1443,311 @@ class DomainTerm:
         except Exception as e:
             logger.error("Failed to load base words", error=str(e))
 
-    async def process_translations(self):
-        """Process translation queue"""
-        while self.running:
-            if not self.translation_queue:
-                await asyncio.sleep(TRANSLATION_INTERVAL)
-                continue
-
-            word = self.translation_queue.pop()
-            logger.info("Processing translation", show_console=False, word=word, queue_size=len(self.translation_queue))
-
-            if word in self.db.data["translation_cache"]:
-                translations = self.db.data["translation_cache"][word]
-                logger.info("Translation cache hit", show_console=False, word=word, cached_translations=len(translations))
-            else:
-                translations = await get_translations(word)
-                self.db.data["translation_cache"][word] = translations
-                self.db.save()
-                logger.info("Translation cached", show_console=False, word=word, new_translations=len(translations))
-
-            added_to_queues = 0
-            for translation in translations:
-                cleaned = translation["translation"]["cleaned"]
-                self.webification_queue.add(json.dumps(translation))
-                if cleaned:
-                    self.whois_queue.add(cleaned)
-                    added_to_queues += 1
-
-            logger.info("Translation processing complete", show_console=False, word=word,
-                       words_added_to_queues=added_to_queues)
-            await asyncio.sleep(TRANSLATION_INTERVAL)
+    async def handle_translation(self, word: str) -> bool:
+        """Translate a word and queue its translations for webification and WHOIS"""
+        logger.debug("Processing translation", show_console=False, word=word, queue_size=len(self.translation_queue))
+
+        cached = self.translation_cache.get(word, {})
+        if isinstance(cached, list):
+            # Older databases stored a flat list of successful translations
+            cached = {translation["language"]["code"]: translation for translation in cached}
+            self.db.set("translation_cache", word, cached)
+
+        # Only request languages that haven't been translated yet, so failed ones are retried on their own
+        missing_codes = [code for code in LANG_CODES if code not in cached]
+        if missing_codes:
+            new_translations = await get_translations(word, missing_codes)
+            cached = {**cached, **new_translations}
+            self.db.set("translation_cache", word, cached)
+            logger.info("Translation cached", show_console=False, word=word,
+                       new_languages=len(new_translations), missing_languages=len(missing_codes))
+        else:
+            logger.debug("Translation cache hit", show_console=False, word=word, cached_languages=len(cached))
 
-    async def process_synonyms(self):
-        """Process synonym queue"""
-        while self.running:
-            if not self.synonym_queue:
-                await asyncio.sleep(SYNONYM_INTERVAL)
+        added_to_queues = 0
+        for translation in cached.values():
+            if not translation:
                 continue
-
-            word = self.synonym_queue.pop()
-            logger.info("Processing synonyms", word=word, queue_size=len(self.synonym_queue))
-
-            if word in self.db.data["synonyms_cache"]:
-                synonyms = self.db.data["synonyms_cache"][word]
-                logger.info("Synonym cache hit", word=word, cached_synonyms=len(synonyms))
+            cleaned = translation["translation"]["cleaned"]
+            await self.webification_queue.add(translation)
+            if self._acceptable(cleaned):
+                await self.whois_queue.add(cleaned)
+                added_to_queues += 1
+
+        logger.debug("Translation processing complete", show_console=False, word=word,
+                    words_added_to_queues=added_to_queues)
+
+        return bool(missing_codes)
+
+    async def handle_synonyms(self, words: List[str]) -> bool:
+        """Find synonyms for a batch of words and queue them for webification and WHOIS"""
+        if logger.is_enabled("debug"):
+            logger.debug("Processing synonyms", words=", ".join(words), queue_size=len(self.synonym_queue))
+
+        synonyms_cache = self.synonyms_cache
+        synonyms_by_word = {}
+        uncached_words = []
+        for word in words:
+            synonyms = synonyms_cache.get(word, _MISS)
+            if synonyms is _MISS:
+                uncached_words.append(word)
             else:
-                synonyms = await get_synonyms(word)
-                self.db.data["synonyms_cache"][word] = synonyms
-                self.db.save()
+                synonyms_by_word[word] = synonyms
+                logger.debug("Synonym cache hit", word=word, cached_synonyms=len(synonyms))
+
+        if uncached_words:
+            for word, synonyms in (await get_synonyms_batch(uncached_words)).items():
+                self.db.set("synonyms_cache", word, synonyms)
+                synonyms_by_word[word] = synonyms
                 logger.info("Synonyms cached", word=word, new_synonyms=len(synonyms))
 
+        for word in words:
+            synonyms = synonyms_by_word[word]
             added_to_queues = 0
             for synonym in synonyms:
                 if synonym:
-                    self.whois_queue.add(synonym)
+                    if self._acceptable(synonym):
+                        await self.whois_queue.add(synonym)
                     # Create translation object for webification
                     translation = {
                         "word": synonym,
-                        "language": {"name": "English", "code": "en"},
+                        "language": {"name": LANG_NAME_BY_CODE["en"], "code": "en"},
                         "translation": {"raw": synonym, "cleaned": synonym}
                     }
-                    self.webification_queue.add(json.dumps(translation))
+                    await self.webification_queue.add(translation)
                     added_to_queues += 1
 
-            logger.info("Synonym processing complete", word=word,
-                       synonyms_added_to_queues=added_to_queues)
-            await asyncio.sleep(SYNONYM_INTERVAL)
-
-    async def process_webifications(self):
-        """Process webification queue"""
-        while self.running:
-            if not self.webification_queue:
-                await asyncio.sleep(WEBIFICATION_INTERVAL)
-                continue
+            logger.debug("Synonym processing complete", word=word,
+                        synonyms_added_to_queues=added_to_queues)
 
-            translation_json = self.webification_queue.pop()
-            translation = json.loads(translation_json)
-            cleaned_word = translation["translation"]["cleaned"]
+        return bool(uncached_words)
 
-            logger.info("Processing webification", word=cleaned_word,
-                       queue_size=len(self.webification_queue))
+    async def handle_webifications(self, translations: List[Dict]) -> bool:
+        """Webify a batch of translations and queue the results for WHOIS"""
+        logger.debug("Processing webifications", word_count=len(translations),
+                     queue_size=len(self.webification_queue))
 
-            if cleaned_word in self.db.data["webified_cache"]:
-                webified_data = self.db.data["webified_cache"][cleaned_word]
-                webified_words = webified_data.get("webifiedWords", [])
-                logger.info("Webification cache hit", word=cleaned_word,
-                           cached_webified_words=len(webified_words))
+        webified_cache = self.webified_cache
+        webified_by_word = {}
+        uncached_translations = []
+        for translation in translations:
+            cleaned_word = translation["translation"]["cleaned"]
+            webified_data = webified_cache.get(cleaned_word, _MISS)
+            if webified_data is _MISS:
+                uncached_translations.append(translation)
             else:
-                webified_words = await get_webified_words(translation)
-                self.db.data["webified_cache"][cleaned_word] = {
+                webified_by_word[cleaned_word] = webified_data.get("webifiedWords", [])
+                logger.debug("Webification cache hit", word=cleaned_word,
+                             cached_webified_words=len(webified_by_word[cleaned_word]))
+
+        if uncached_translations:
+            new_webified = await get_webified_words_batch(uncached_translations)
+            for translation in uncached_translations:
+                cleaned_word = translation["translation"]["cleaned"]
+                webified_words = new_webified[cleaned_word]
+                self.db.set("webified_cache", cleaned_word, {
                     **translation,
                     "webifiedWords": webified_words
-                }
-                self.db.save()
+                })
+                webified_by_word[cleaned_word] = webified_words
                 logger.info("Webification cached", word=cleaned_word,
                            new_webified_words=len(webified_words))
 
-            words_to_check = [cleaned_word] + webified_words
+        for cleaned_word, webified_words in webified_by_word.items():
             added_to_whois = 0
-            for word in words_to_check:
-                if word:
-                    self.whois_queue.add(word)
+            for word in [cleaned_word] + webified_words:
+                if self._acceptable(word):
+                    await self.whois_queue.add(word)
                     added_to_whois += 1
 
-            logger.info("Webification processing complete", original_word=cleaned_word,
-                       words_added_to_whois=added_to_whois)
-            await asyncio.sleep(WEBIFICATION_INTERVAL)
+            logger.debug("Webification processing complete", original_word=cleaned_word,
+                         words_added_to_whois=added_to_whois)
 
-    async def process_whois(self):
-        """Process WHOIS queue"""
-        while self.running:
-            if not self.whois_queue:
-                await asyncio.sleep(WHOIS_INTERVAL)
-                continue
-
-            word = self.whois_queue.pop()
-            logger.info("Processing WHOIS", show_console=False, word=word, queue_size=len(self.whois_queue))
+        return bool(uncached_translations)
 
-            if len(word) < self.min_length or len(word) > self.max_length:
-                logger.debug("WHOIS skipped", show_console=False, word=word, reason="length_filter",
-                           length=len(word), min_length=self.min_length, max_length=self.max_length)
-                continue
+    async def handle_whois(self, words: List[str]) -> bool:
+        """Check domain availability for a batch of words and queue available ones for the remaining checks"""
+        logger.debug("Processing WHOIS", show_console=False, word_count=len(words), queue_size=len(self.whois_queue))
 
-            if word in self.db.data["whois_cache"]:
-                availability = self.db.data["whois_cache"][word]
-                logger.info("WHOIS cache hit", show_console=False, word=word, cached_result=availability)
+        whois_cache = self.whois_cache
+        results = {}
+        uncached_words = []
+        for word in words:
+            cached_result = whois_cache.get(word, _MISS)
+            if cached_result is _MISS:
+                uncached_words.append(word)
             else:
-                availability = await check_domain_availability(word)
-                self.db.data["whois_cache"][word] = availability
-                self.db.save()
-
-            if availability:
-                self.search_queue.add(word)
-                self.rating_queue.add(word)
-                self.npm_queue.add(word)
-                self.social_queue.add(word)
-                logger.info("Domain available - added to all queues", show_console=False, word=word)
+                results[word] = cached_result
+                logger.debug("WHOIS cache hit", show_console=False, word=word, cached_result=cached_result)
+
+        if uncached_words:
+            for word, availability in (await check_domains_availability(uncached_words)).items():
+                results[word] = availability
+                if availability is None:
+                    continue  # The check failed; leave it uncached so the word is checked again when it comes up
+                self.db.set("whois_cache", word, availability)
+                if availability:
+                    self.available_domains += 1
+
+        for word in words:
+            if results[word]:
+                await self.available_queue.add(word)
+                await self.search_queue.add(word)
+                await self.rating_queue.add(word)
+                logger.debug("Domain available - added to all queues", show_console=False, word=word)
             else:
-                logger.info("Domain unavailable - skipping further checks", show_console=False, word=word)
-
-            await asyncio.sleep(WHOIS_INTERVAL)
-
-    async def process_search(self):
-        """Process search evaluation queue"""
-        while self.running:
-            if not self.search_queue:
-                await asyncio.sleep(SEARCH_INTERVAL)
-                continue
-
-            word = self.search_queue.pop()
-            logger.info("Processing search evaluation", word=word, queue_size=len(self.search_queue))
-
-            if word in self.db.data["search_evaluation_cache"]:
-                logger.info("Search evaluation cache hit", word=word)
-                continue
-
-            evaluation = await check_search_results(word)
-            self.db.data["search_evaluation_cache"][word] = evaluation
-            self.db.save()
-
-            await asyncio.sleep(SEARCH_INTERVAL)
-
-    async def process_ratings(self):
-        """Process rating queue"""
-        while self.running:
-            if not self.rating_queue:
-                await asyncio.sleep(RATING_INTERVAL)
-                continue
-
-            word = self.rating_queue.pop()
-            logger.info("Processing rating", word=word, queue_size=len(self.rating_queue))
-
-            if word in self.db.data["ratings_cache"]:
-                rating = self.db.data["ratings_cache"][word]
-                logger.info("Rating cache hit", word=word, cached_rating=rating)
-                continue
-
-            rating = await rate_name(word)
-            self.db.data["ratings_cache"][word] = rating
-            self.db.save()
-
-            await asyncio.sleep(RATING_INTERVAL)
-
-    async def process_npm(self):
-        """Process NPM availability queue"""
-        while self.running:
-            if not self.npm_queue:
-                await asyncio.sleep(1.0)
-                continue
-
-            word = self.npm_queue.pop()
-            logger.info("Processing NPM check", word=word, queue_size=len(self.npm_queue))
-
-            if word in self.db.data["npm_cache"]:
-                availability = self.db.data["npm_cache"][word]
-                logger.info("NPM cache hit", word=word, cached_result=availability)
-                continue
-
-            availability = await check_npm_availability(word)
-            self.db.data["npm_cache"][word] = availability
-            self.db.save()
+                logger.debug("Domain unavailable - skipping further checks", show_console=False, word=word)
+
+        return bool(uncached_words)
+
+    async def handle_available_domain(self, word: str) -> bool:
+        """Run the NPM and social checks for an available domain at the same time"""
+        logger.debug("Processing available domain", word=word, queue_size=len(self.available_queue))
+
+        # The checks hit different services, each capped by its own semaphore
+        requested = await asyncio.gather(self.evaluate_npm(word), self.evaluate_social(word))
+        return any(requested)
+
+    async def evaluate_search(self, word: str) -> bool:
+        """Evaluate search results for an available domain"""
+        logger.debug("Processing search evaluation", word=word)
+
+        if word in self.search_evaluation_cache:
+            logger.debug("Search evaluation cache hit", word=word)
+            return False
+
+        evaluation = await check_search_results(word)
+        if evaluation is not None:
+            # Failed checks stay uncached so they are retried
+            self.db.set("search_evaluation_cache", word, evaluation)
+        return True
+
+    async def handle_ratings(self, words: List[str]) -> bool:
+        """Rate a batch of available domains"""
+        if logger.is_enabled("debug"):
+            logger.debug("Processing ratings", words=", ".join(words), queue_size=len(self.rating_queue))
+
+        ratings_cache = self.ratings_cache
+        uncached_words = []
+        for word in words:
+            cached_rating = ratings_cache.get(word, _MISS)
+            if cached_rating is _MISS:
+                uncached_words.append(word)
+            else:
+                logger.debug("Rating cache hit", word=word, cached_rating=cached_rating)
+
+        if not uncached_words:
+            return False
+
+        whois_cache = self.whois_cache
+        for word, rating in (await rate_names_batch(uncached_words)).items():
+            self.db.set("ratings_cache", word, rating)
+            if whois_cache.get(word):
+                self.rated_domains += 1
+        return True
+
+    async def evaluate_npm(self, word: str) -> bool:
+        """Check NPM package name availability for an available domain"""
+        logger.debug("Processing NPM check", word=word)
+
+        availability = self.npm_cache.get(word, _MISS)
+        if availability is not _MISS:
+            logger.debug("NPM cache hit", word=word, cached_result=availability)
+            return False
+
+        availability = await check_npm_availability(word)
+        self.db.set("npm_cache", word, availability)
+        return True
+
+    async def evaluate_social(self, word: str) -> bool:
+        """Check social media handle availability for an available domain"""
+        logger.debug("Processing social media check", word=word)
+
+        availability = self.social_cache.get(word, _MISS)
+        if availability is not _MISS:
+            if logger.is_enabled("debug"):
+                available_count = sum(1 for avail in availability.values() if avail)
+                logger.debug("Social media cache hit", word=word,
+                             platforms_available=available_count)
+            return False
 
-            await asyncio.sleep(1.0)
+        availability = await check_social_availability(word)
+        self.db.set("social_cache", word, availability)
+        return True
 
-    async def process_social(self):
-        """Process social media availability queue"""
+    async def stage_worker(self, name: str, stage: Stage):
+        """Feed a stage's queue to its handler, pausing for the stage's interval after each uncached request"""
         while self.running:
-            if not self.social_queue:
-                await asyncio.sleep(2.0)
-                continue
-
-            word = self.social_queue.pop()
-            logger.info("Processing social media check", word=word, queue_size=len(self.social_queue))
+            if stage.batch_size:
+                items = await stage.queue.get_batch(stage.batch_size, BATCH_WAIT)
+            else:
+                items = await stage.queue.get()
 
-            if word in self.db.data["social_cache"]:
-                availability = self.db.data["social_cache"][word]
-                available_count = sum(1 for avail in availability.values() if avail)
-                logger.info("Social media cache hit", word=word,
-                           platforms_available=available_count)
+            try:
+                requested = await stage.handler(items)
+            except Exception as e:
+                # One bad item shouldn't stop the whole stage
+                logger.error("Stage handler failed", stage=name, error=str(e))
                 continue
+            finally:
+                for item in (items if stage.batch_size else [items]):
+                    stage.queue.done(item)
 
-            availability = await check_social_availability(word)
-            self.db.data["social_cache"][word] = availability
-            self.db.save()
-
-            await asyncio.sleep(2.0)
+            if requested and stage.interval:
+                await asyncio.sleep(stage.interval)
 
     async def status_reporter(self):
         """Report queue status"""
         while self.running:
-            queue_sizes = {
-                "translations": len(self.translation_queue),
-                "synonyms": len(self.synonym_queue),
-                "webifications": len(self.webification_queue),
-                "whois": len(self.whois_queue),
-                "search": len(self.search_queue),
-                "ratings": len(self.rating_queue),
-                "npm": len(self.npm_queue),
-                "social": len(self.social_queue),
-            }
+            queue_sizes = {name: len(stage.queue) for name, stage in self.stages.items()}
 
             # Get cache statistics (file only)
-            cache_stats = {}
-            for cache_name, cache_data in self.db.data.items():
-                if isinstance(cache_data, dict):
-                    cache_stats[f"{cache_name}_cached"] = len(cache_data)
-
-            # Count available domains
-            available_domains = 0
-            rated_domains = 0
-            for word, available in self.db.data.get("whois_cache", {}).items():
-                if available:
-                    available_domains += 1
-                    if word in self.db.data.get("ratings_cache", {}):
-                        rated_domains += 1
+            cache_stats = {f"{cache_name}_cached": count for cache_name, count in self.db.counts().items()}
 
             # Detailed logging to file
             logger.info("Status report", show_console=False,
                        **queue_sizes,
                        **cache_stats,
-                       available_domains=available_domains,
-                       rated_domains=rated_domains)
+                       available_domains=self.available_domains,
+                       rated_domains=self.rated_domains)
 
             # Simple console status
             total_queue_items = sum(queue_sizes.values())
             if total_queue_items > 0:
-                print(f"Processing... {total_queue_items} items in queues | {available_domains} domains available | {rated_domains} rated")
+                print(f"Processing... {total_queue_items} items in queues | {self.available_domains} domains available | {self.rated_domains} rated")
             else:
-                print(f"Monitoring... {available_domains} domains found, {rated_domains} rated")
+                print(f"Monitoring... {self.available_domains} domains found, {self.rated_domains} rated")
 
             await asyncio.sleep(STATUS_INTERVAL)
 
     async def base_words_monitor(self):
         """Monitor base words file for changes"""
+        if watchfiles:
+            # Watch the directory so editors that save by replacing the file are still picked up, but not
+            # its subdirectories: logs/ is written on every log entry
+            base_words_path = os.path.abspath(BASE_WORDS_FILE)
+            try:
+                async for _ in watchfiles.awatch(os.path.dirname(base_words_path), recursive=False,
+                                                 watch_filter=lambda change, path: path == base_words_path):
+                    await self.load_base_words()
+                return
+            except Exception as e:
+                # e.g. the inotify watch limit, or a watchfiles too old for recursive=
+                logger.error("Base words watcher failed - polling instead", error=str(e))
+
         while self.running:
             await self.load_base_words()
             await asyncio.sleep(BASE_WORDS_CHECK_INTERVAL)
 
+    async def db_flusher(self):
+        """Persist cache changes every DB_FLUSH_INTERVAL, or sooner once DB_FLUSH_MAX_CHANGES pile up"""
+        while self.running:
+            try:
+                await asyncio.wait_for(self.db.flush_requested.wait(), DB_FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            await self.db.flush_in_background()
+
     async def run(self):
         """Run the domain term finder"""
         logger.info("Starting DomainTerm", min_length=self.min_length, max_length=self.max_length)
@@ -1036,60 +1758,55 @@ class DomainTerm:
         # Start all processing tasks
         tasks = [
             self.base_words_monitor(),
-            self.process_translations(),
-            self.process_synonyms(),
-            self.process_webifications(),
-            self.process_whois(),
-            self.process_search(),
-            self.process_ratings(),
-            self.process_npm(),
-            self.process_social(),
             self.status_reporter(),
+            self.db_flusher(),
         ]
+        for name, stage in self.stages.items():
+            tasks.extend(self.stage_worker(name, stage) for _ in range(stage.workers))
 
         try:
             await asyncio.gather(*tasks)
         except KeyboardInterrupt:
             logger.info("Stopping DomainTerm")
             self.running = False
+        finally:
+            self.db.flush()
+            http_pool.close()
 
     def show_results(self):
         """Show current results"""
         logger.info("Showing results")
 
-        ratings = self.db.data.get("ratings_cache", {})
-        whois = self.db.data.get("whois_cache", {})
-        npm = self.db.data.get("npm_cache", {})
-        social = self.db.data.get("social_cache", {})
-        search_eval = self.db.data.get("search_evaluation_cache", {})
+        whois = self.db.data["whois_cache"]
+        npm = self.db.data["npm_cache"]
+        social = self.db.data["social_cache"]
+        search_eval = self.db.data["search_evaluation_cache"]
 
         # Filter for available domains with ratings
-        available_domains = []
-
-        for word, rating in ratings.items():
-            if (whois.get(word) and  # Domain available
-                isinstance(rating, (int, float)) and rating > 0):
-
-                search_data = search_eval.get(word, {})
-                social_data = social.get(word, {})
-                social_count = sum(1 for available in social_data.values() if available) if social_data else 0
-
-                entry = {
-                    "word": word,
-                    "rating": rating,
-                    "domain_available": whois.get(word, False),
-                    "npm_available": npm.get(word, False),
-                    "social_available": social_count,
-                    "search_available": search_data.get("isAvailable", None),
-                    "search_confidence": search_data.get("confidence", None),
-                }
-                available_domains.append(entry)
+        available_domains = [
+            (word, rating) for word, rating in self.db.items("ratings_cache")
+            if isinstance(rating, (int, float)) and rating > 0 and whois.get(word)
+        ]
 
-        # Sort by rating
-        available_domains.sort(key=lambda x: x["rating"], reverse=True)
+        # Only the top entries are shown, so pick them without sorting everything
+        top_domains = []
+        for word, rating in heapq.nlargest(50, available_domains, key=itemgetter(1)):
+            search_data = search_eval.get(word, {})
+            social_data = social.get(word, {})
+            social_count = sum(1 for available in social_data.values() if available) if social_data else 0
+
+            top_domains.append({
+                "word": word,
+                "rating": rating,
+                "domain_available": whois.get(word, False),
+                "npm_available": npm.get(word, False),
+                "social_available": social_count,
+                "search_available": search_data.get("isAvailable", None),
+                "search_confidence": search_data.get("confidence", None),
+            })
 
         print("\n=== TOP AVAILABLE DOMAINS ===")
-        for i, entry in enumerate(available_domains[:50], 1):
+        for i, entry in enumerate(top_domains, 1):
             search_info = ""
             if entry["search_available"] is not None:
                 search_info = f" | Search: {'✓' if entry['search_available'] else '✗'} ({entry['search_confidence']:.0f}%)"
@@ -1100,14 +1817,8 @@ class DomainTerm:
 
         print(f"\nTotal available domains: {len(available_domains)}")
 
-        # Show cache statistics
-        cache_stats = {}
-        for cache_name, cache_data in self.db.data.items():
-            if isinstance(cache_data, dict):
-                cache_stats[cache_name] = len(cache_data)
-
         print("\n=== CACHE STATISTICS ===")
-        for cache_name, count in cache_stats.items():
+        for cache_name, count in self.db.counts().items():
             print(f"{cache_name}: {count} entries")
 
 async def check_social_command(name: str):
@@ -1115,57 +1826,20 @@ async def check_social_command(name: str):
     logger.info("Checking social availability", name=name)
 
     try:
-        # Use subprocess to call sherlock if available
-        result = subprocess.run([
-            "sherlock", "--output", "./social.txt",
-            "--site", "GitHub", "--site", "GitLab",
-            "--site", "Bitbucket", "--site", "LinkedIn",
-            name
-        ], capture_output=True, text=True, timeout=60)
-
-        if result.returncode == 0:
-            if os.path.exists("social.txt"):
-                with open("social.txt", 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                if len(content.strip().split('\n')) > 1:
-                    print("Name seems taken on at least one platform:")
-                    print(content)
-                    return False
-                else:
-                    print("Name seems available on all checked platforms")
-                    return True
-        else:
-            # Fallback to our own implementation
-            availability = await check_social_availability(name)
-            available_count = sum(1 for avail in availability.values() if avail)
-            total_count = len(availability)
-
-            print(f"Social media availability for '{name}':")
-            for platform, available in availability.items():
-                status = "✓ Available" if available else "✗ Taken"
-                print(f"  {platform:10s}: {status}")
-
-            print(f"\nSummary: {available_count}/{total_count} platforms available")
-            return available_count == total_count
-
-    except subprocess.TimeoutExpired:
-        logger.error("Sherlock command timed out")
-        return False
-    except FileNotFoundError:
-        logger.info("Sherlock not found, using built-in social checker")
-        # Use our implementation
         availability = await check_social_availability(name)
-        available_count = sum(1 for avail in availability.values() if avail)
-        total_count = len(availability)
+    finally:
+        http_pool.close()
+
+    available_count = sum(1 for avail in availability.values() if avail)
+    total_count = len(availability)
 
-        print(f"Social media availability for '{name}':")
-        for platform, available in availability.items():
-            status = "✓ Available" if available else "✗ Taken"
-            print(f"  {platform:10s}: {status}")
+    print(f"Social media availability for '{name}':")
+    for platform, available in availability.items():
+        status = "✓ Available" if available else "✗ Taken"
+        print(f"  {platform:10s}: {status}")
 
-        print(f"\nSummary: {available_count}/{total_count} platforms available")
-        return available_count == total_count
+    print(f"\nSummary: {available_count}/{total_count} platforms available")
+    return available_count == total_count
 
 def main():
     import argparse